@@ -23,15 +23,19 @@ Usage:
 """
 
 import argparse
+import atexit
+import contextlib
+import errno
 import glob
-import json
+import mmap
 import os
+import random
 import shutil
 import struct
 import subprocess
 import sys
 import time
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Optional, List, Tuple
 
@@ -52,7 +56,23 @@ except ImportError:
 SCRIPT_VERSION = "3.1"
 OUT_DIR_NAME = "Fixed for BSI"
 DEFAULT_GENRE = "Children's Music"
-COPY_BUF_SIZE = 1024 * 1024  # 1MB buffer for streaming
+STALE_TMP_AGE = 10 * 60 # A temp file untouched this long (seconds) was left by a dead run
+
+def _copy_buf_size(default=8 << 20, minimum=64 << 10):
+    """BSIFIX_COPY_BUF in bytes, falling back to the default if unset or not a number."""
+    try:
+        return max(minimum, int(os.environ.get("BSIFIX_COPY_BUF", default)))
+    except ValueError:
+        return default
+
+COPY_BUF_SIZE = _copy_buf_size()  # 8MB buffer for streaming
+
+# Precompiled layouts for the chunk-walking hot paths
+_CHUNK_HDR = struct.Struct('<4sI') # ckID, ckSize
+_FMT_PCM = struct.Struct('<HHIIHH') # WAVEFORMAT + wBitsPerSample
+_FMT_EXT_TAIL = struct.Struct('<HIIHH') # _FMT_PCM minus wFormatTag
+_U16 = struct.Struct('<H')
+_U32 = struct.Struct('<I')
 
 console = Console()
 
@@ -69,44 +89,151 @@ def get_ffprobe_metadata(path):
     """Return a dict of tags from ffprobe."""
     cmd = [
         "ffprobe", "-v", "quiet",
-        "-print_format", "json",
-        "-show_format",
+        "-of", "default=nw=1:nk=0",
+        "-show_entries", "format_tags=title,artist,album,date,date_created,genre,track,composer,comment,encoded_by",
         path
     ]
     try:
         res = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
-        data = json.loads(res.stdout)
-        return data.get("format", {}).get("tags", {})
-    except (subprocess.CalledProcessError, json.JSONDecodeError):
+    except subprocess.CalledProcessError:
         return {}
+    tags = {}
+    for line in res.stdout.decode("utf-8", "replace").splitlines():
+        # "TAG:title=Some Title"
+        if line.startswith("TAG:") and "=" in line:
+            k, v = line[4:].split("=", 1)
+            tags.setdefault(k, v)
+    return tags
+
+# RIFF INFO ids mapped to ffprobe's tag names.
+RIFF_INFO_KEYS = {
+    b'INAM': "title", b'IART': "artist", b'IPRD': "album",
+    b'ICRD': "date", b'IGNR': "genre", b'IPRT': "track", b'ITRK': "track",
+    b'ICMT': "comment", b'ITCH': "encoded_by",
+}
+
+def _parse_info(payload):
+    """Return a dict of tags from a LIST/INFO payload, keyed like ffprobe."""
+    tags = {}
+    for fourcc, size, offset in yield_chunks(payload, 4):
+        value = payload[offset:offset + size].split(b'\x00', 1)[0]
+        key = RIFF_INFO_KEYS.get(fourcc)
+        if key and value and key not in tags:
+            try:
+                tags[key] = value.decode('utf-8')
+            except UnicodeDecodeError:
+                tags[key] = value.decode('latin-1')
+    return tags
+
+class _AsciiTable(dict):
+    """str.translate table: ASCII maps to itself, everything else to '?'."""
+    def __missing__(self, cp):
+        return 0x3F
+
+_ASCII_TABLE = _AsciiTable((i, i) for i in range(0x80))
 
 def ascii_clean(s, max_len=None):
     """Enforce ASCII, replacing non-ascii with '?', and truncate."""
     if not s:
         s = ""
-    b = s.encode("ascii", "replace") # Replace with '?'
-    s_ascii = b.decode("ascii")
-    if max_len and len(s_ascii) > max_len:
-        s_ascii = s_ascii[:max_len]
-    return s_ascii
+    if not s.isascii():
+        s = s.translate(_ASCII_TABLE) # Replace with '?'
+    if max_len:
+        s = s[:max_len]
+    return s
 
 def pad_bytes(b_data, length):
     if len(b_data) > length:
         return b_data[:length]
     return b_data + b'\x00' * (length - len(b_data))
 
+def _append_chunk(buf, cid, payload):
+    """Append a whole chunk (header, payload, pad byte) to a bytearray."""
+    buf += _CHUNK_HDR.pack(cid, len(payload))
+    buf += payload
+    if len(payload) % 2 == 1: buf += b'\x00'
+
+def _kcopy(f_out, f_in, offset, size):
+    """
+    Append `size` bytes of f_in starting at `offset` to f_out.
+    Uses sendfile() so the bytes never enter Python; falls back to a
+    buffered read/write loop where that is unsupported (Windows, macOS files).
+    """
+    f_out.flush() # sendfile writes at the raw fd position
+    remaining = size
+    if hasattr(os, "sendfile"):
+        try:
+            while remaining > 0:
+                sent = os.sendfile(f_out.fileno(), f_in.fileno(), offset, remaining)
+                if sent == 0:
+                    raise EOFError(f"Source ended {remaining} bytes short of its data chunk")
+                offset += sent
+                remaining -= sent
+            return
+        except OSError as e:
+            if e.errno not in (errno.EINVAL, errno.ENOSYS, errno.ENOTSOCK, errno.EOPNOTSUPP):
+                raise
+
+    f_in.seek(offset)
+    _copy_stream(f_in, f_out, remaining)
+
+def _preallocate(f_out, size):
+    """Reserve `size` bytes for f_out up front where the OS supports it."""
+    try:
+        os.posix_fallocate(f_out.fileno(), 0, size)
+    except (AttributeError, OSError): # macOS/Windows, or unsupported filesystem
+        pass
+
+def _copy_stream(f_in, f_out, size=None):
+    """
+    Copy `size` bytes (or everything up to EOF if None) from f_in's current
+    position to f_out through one reused buffer. Returns the bytes copied;
+    raises EOFError if f_in ends before `size` bytes.
+    """
+    view = memoryview(bytearray(COPY_BUF_SIZE if size is None else min(size, COPY_BUF_SIZE)))
+    copied = 0
+    while size is None or copied < size:
+        want = len(view) if size is None else min(size - copied, len(view))
+        n = f_in.readinto(view[:want])
+        if not n: break
+        f_out.write(view[:n])
+        copied += n
+    if size is not None and copied < size:
+        raise EOFError(f"Source ended {size - copied} bytes short of its data chunk")
+    return copied
+
 # ------------------------------------------------------------------------------
 # Chunk Builders
 # ------------------------------------------------------------------------------
 
+# Fixed parts of the chunks, built once. TimeReference, Version (0), UMID,
+# Reserved and the unused cart fields are all zero.
+_BEXT_TEMPLATE = bytes(602) + b"CodingHistory=BSIFix3.1\r\n"
+
+_CART_TEMPLATE = bytearray(2048)
+_CART_TEMPLATE[0:4] = b"0101" # Version
+_CART_TEMPLATE[488:552] = pad_bytes(b"BSIFix", 64) # ProducerAppID
+_CART_TEMPLATE[552:616] = pad_bytes(SCRIPT_VERSION.encode('ascii'), 64) # ProducerAppVersion
+_CART_TEMPLATE = bytes(_CART_TEMPLATE)
+
+_rng = None
+_rng_pid = None
+
+def _worker_rng():
+    """Per-process RNG, seeded once from os.urandom (reseeded after a fork)."""
+    global _rng, _rng_pid
+    if _rng is None or _rng_pid != os.getpid():
+        _rng = random.Random(os.urandom(32))
+        _rng_pid = os.getpid()
+    return _rng
+
 def build_bext_chunk(title, artist, date_str, time_str):
     """Build BWF 'bext' chunk data (Version 0). Everything strictly ASCII."""
     desc = ascii_clean(title, 256).encode('ascii')
     orig = ascii_clean(artist, 32).encode('ascii')
     
     # OriginatorReference: Unique ID.
-    orig_ref = b'bsifix-' + os.urandom(8).hex().encode('ascii')
-    orig_ref = pad_bytes(orig_ref, 32)
+    orig_ref = b'bsifix-' + _worker_rng().randbytes(8).hex().encode('ascii')
     
     if not date_str:
         now = datetime.now()
@@ -116,23 +243,12 @@ def build_bext_chunk(title, artist, date_str, time_str):
     b_date = ascii_clean(date_str, 10).encode('ascii')
     b_time = ascii_clean(time_str, 8).encode('ascii')
     
-    time_ref_low = 0
-    time_ref_high = 0
-    version = 0
-    umid = b'\x00' * 64
-    
-    out = bytearray()
-    out.extend(pad_bytes(desc, 256))
-    out.extend(pad_bytes(orig, 32))
-    out.extend(pad_bytes(orig_ref, 32))
-    out.extend(pad_bytes(b_date, 10))
-    out.extend(pad_bytes(b_time, 8))
-    out.extend(struct.pack('<IIH', time_ref_low, time_ref_high, version))
-    out.extend(umid)
-    out.extend(b'\x00' * 190) # Loudness(10) + Reserved(180)
-    
-    coding_hist = b"CodingHistory=BSIFix3.1\r\n"
-    out.extend(coding_hist)
+    out = bytearray(_BEXT_TEMPLATE)
+    out[0:256] = pad_bytes(desc, 256)
+    out[256:288] = pad_bytes(orig, 32)
+    out[288:320] = pad_bytes(orig_ref, 32)
+    out[320:330] = pad_bytes(b_date, 10)
+    out[330:338] = pad_bytes(b_time, 8)
     
     return out
 
@@ -141,58 +257,278 @@ def build_cart_chunk(title, artist, cut_id):
     def p(s, l):
         return pad_bytes(ascii_clean(s, l).encode('ascii'), l)
         
-    out = bytearray()
-    out.extend(p("0101", 4))
-    out.extend(p(title, 64))
-    out.extend(p(artist, 64))
-    out.extend(p(cut_id, 64))
-    out.extend(p("", 64*4)) # ClientID...OutCue
-    out.extend(p("", 10)) # StartDate
-    out.extend(p("", 8))  # StartTime
-    out.extend(p("", 10)) # EndDate
-    out.extend(p("", 8))  # EndTime
-    out.extend(p("BSIFix", 64)) # ProducerAppID
-    out.extend(p(SCRIPT_VERSION, 64)) # ProducerAppVersion
-    out.extend(p("", 64)) # UserDef
-    out.extend(struct.pack('<I', 0)) # dwLevelReference
-    out.extend(b'\x00' * 64) # PostTimer
-    out.extend(b'\x00' * 276) # Reserved
-    out.extend(p("", 1024)) # URL
+    out = bytearray(_CART_TEMPLATE)
+    out[4:68] = p(title, 64)
+    out[68:132] = p(artist, 64)
+    out[132:196] = p(cut_id, 64)
     
     return out
 
+# RIFF INFO ids for our tags, matching what ffmpeg's wav muxer writes.
+INFO_TAGS = [
+    ("title", b'INAM'), ("artist", b'IART'), ("album", b'IPRD'),
+    ("date", b'ICRD'), ("genre", b'IGNR'), ("track", b'IPRT'),
+    ("comment", b'ICMT'), ("encoded_by", b'ITCH'),
+]
+
+def build_info_chunk(meta):
+    """Build 'LIST' INFO chunk. Values stay UTF-8, NUL-terminated like ffmpeg."""
+    tags = dict(meta)
+    out = bytearray(b'INFO')
+    for key, fourcc in INFO_TAGS:
+        v = tags.get(key)
+        if not v:
+            continue
+        b = v.encode('utf-8') + b'\x00'
+        out.extend(_CHUNK_HDR.pack(fourcc, len(b)))
+        out.extend(b)
+        if len(b) % 2 == 1: out.extend(b'\x00')
+
+    return out
+
 # ------------------------------------------------------------------------------
 # Processing
 # ------------------------------------------------------------------------------
 
-def yield_chunks(f):
+def _parse_fmt(payload):
     """
-    Generator that reads RIFF chunks.
+    Returns (format_tag, bits, channels, sample_rate) if a fmt payload
+    describes integer PCM (plain or Extensible with PCM SubFormat), else None.
     """
-    f.seek(12) # Skip RIFF header
+    if len(payload) < 16:
+        return None
+    format_tag, channels, sample_rate, _, _, bits = _FMT_PCM.unpack_from(payload)
+    if format_tag == 0xFFFE:
+        # SubFormat GUID starts with the real format tag
+        if len(payload) < 26 or _U16.unpack_from(payload, 24)[0] != 0x0001:
+            return None
+    elif format_tag != 0x0001:
+        return None
+    return format_tag, bits, channels, sample_rate
+
+def _scan_source(src):
+    """
+    Walk the source's chunks once and return everything later steps need:
+    (container, pcm, tags, has_id3, fmt_payload, data_chunk_info).
+      container        b'RIFF', b'RF64' or b'BW64'; None if not a WAVE file
+      pcm              _parse_fmt() of the fmt chunk (None unless it precedes a data chunk)
+      tags             LIST/INFO tags, or None if there is no INFO list
+      has_id3          True if there is an 'id3 '/'ID3 ' chunk (only ffprobe reads those)
+      fmt_payload      raw fmt payload, or None
+      data_chunk_info  (size, offset) of the data payload, or None
+    """
+    container = tags = fmt_payload = data_chunk_info = None
+    has_id3 = False
+    try:
+        with _mapped(src) as mv:
+            header = bytes(mv[:12])
+            if header[:4] in (b'RIFF', b'RF64', b'BW64') and header[8:12] == b'WAVE':
+                container = header[:4]
+                for cid, size, offset in yield_chunks(mv):
+                    if cid == b'fmt ' and fmt_payload is None and data_chunk_info is None:
+                        fmt_payload = bytes(mv[offset:offset + size])
+                    elif cid == b'data' and data_chunk_info is None:
+                        data_chunk_info = (size, offset)
+                    elif cid == b'LIST' and tags is None and bytes(mv[offset:offset + 4]) == b'INFO':
+                        tags = _parse_info(bytes(mv[offset:offset + size]))
+                    elif cid in (b'id3 ', b'ID3 '):
+                        has_id3 = True
+    except (OSError, ValueError): # ValueError: empty file can't be mapped
+        pass
+    pcm = None
+    if fmt_payload is not None and data_chunk_info is not None:
+        pcm = _parse_fmt(fmt_payload)
+    return container, pcm, tags, has_id3, fmt_payload, data_chunk_info
+
+def _can_skip_ffmpeg(container, pcm):
+    """True if a scanned source is 16/24-bit PCM in a plain RIFF file."""
+    return container == b'RIFF' and pcm is not None and pcm[1] in (16, 24)
+
+@contextlib.contextmanager
+def _mapped(path):
+    """Read-only memoryview over an mmap of the whole file."""
+    with open(path, 'rb') as f, \
+         mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+         memoryview(mm) as mv:
+        yield mv
+
+def yield_chunks(mv, pos=12):
+    """
+    Generator that walks RIFF chunks in a buffer (normally a memoryview of
+    the whole file), starting at `pos` (12 skips the RIFF header; 4 walks a
+    LIST payload). Yields (cid, size, offset) where offset points at the
+    payload, so the chunk as stored spans [offset - 8, offset + size).
+    """
+    end = len(mv)
+    while pos + 8 <= end:
+        cid, size = _CHUNK_HDR.unpack_from(mv, pos)
+        offset = pos + 8
+        if offset + size > end: # Truncated chunk
+            if cid != b'data':
+                break
+            size = end - offset
+        yield cid, size, offset
+        pos = offset + size + (size % 2)
+
+def yield_stream_chunks(f):
+    """
+    Generator that reads RIFF chunks sequentially from a non-seekable stream.
+    Yields (cid, size, raw) where raw is the chunk as stored (8-byte header
+    plus payload, no pad byte), so it can be spliced verbatim. For 'data' raw
+    is None and the caller must consume the audio before advancing; a size
+    of 0xFFFFFFFF means "up to EOF" (ffmpeg can't patch sizes on a pipe).
+    """
+    header = f.read(12)
+    if not header:
+        return # ffmpeg failed; its exit status reports why
+    if len(header) != 12 or header[:4] != b'RIFF' or header[8:12] != b'WAVE':
+        raise ValueError("ffmpeg did not produce a RIFF/WAVE stream")
     while True:
         header = f.read(8)
-        if not header or len(header) != 8:
+        if len(header) != 8:
             break
-        cid, size = struct.unpack('<4sI', header)
-        
-        # If it's a data chunk or very large, return offset
-        if cid == b'data' or size > 1024*1024:
-            offset = f.tell()
-            yield cid, size, offset
-            f.seek(size, 1) # Skip
+        cid, size = _CHUNK_HDR.unpack(header)
+        if cid == b'data':
+            yield cid, size, None
         else:
-            data = f.read(size)
-            yield cid, size, data
-            
+            raw = header + f.read(size)
+            if len(raw) != 8 + size: # Truncated chunk; its header would lie
+                break
+            yield cid, size, raw
         if size % 2 == 1:
             f.read(1)
 
-def process_single_file(src: str, out_root: Optional[str], in_place: bool) -> str:
+def _fix_fmt(payload):
+    """Coerce a WAVE_FORMAT_EXTENSIBLE fmt payload to a 16-byte PCM one."""
+    if len(payload) >= 20 and _U16.unpack_from(payload)[0] == 0xFFFE: # Extensible -> PCM
+        nChannels, nSamplesPerSec, nAvgBytes, nBlockAlign, wBits = _FMT_EXT_TAIL.unpack_from(payload, 2)
+        return _FMT_PCM.pack(0x0001, nChannels, nSamplesPerSec, nAvgBytes, nBlockAlign, wBits)
+    return payload
+
+def _assemble_mapped(f_out, f_in, fmt_payload, data_chunk_info, bext_data, cart_data, info_data):
+    """
+    Write the fixed WAV (fmt -> data -> bext -> cart -> LIST) from a PCM
+    source file, using the chunk layout found by _scan_source. The audio is
+    copied with _kcopy; every size is known up front, so nothing is patched later.
+    """
+    fmt_payload = _fix_fmt(fmt_payload)
+
+    # Small pieces are gathered so the header and the tail are one write each
+    head = bytearray(b'RIFF\x00\x00\x00\x00WAVE')
+    tail = bytearray()
+    data_size = 0
+    
+    # 1. fmt
+    if fmt_payload is not None:
+        _append_chunk(head, b'fmt ', fmt_payload)
+        
+    # 2. Data (Immediate audio for legacy compat)
+    if data_chunk_info:
+        data_size, offset = data_chunk_info
+        head += _CHUNK_HDR.pack(b'data', data_size)
+        if data_size % 2 == 1: tail += b'\x00'
+
+    # 3. bext/cart/LIST (Metadata at end)
+    for cid, d in [(b'bext', bext_data), (b'cart', cart_data), (b'LIST', info_data)]:
+        _append_chunk(tail, cid, d)
+
+    file_size = len(head) + data_size + len(tail)
+    head[4:8] = _U32.pack(file_size - 8)
+    _preallocate(f_out, file_size)
+    f_out.write(head)
+    if data_chunk_info:
+        _kcopy(f_out, f_in, offset, data_size)
+    f_out.write(tail)
+
+def _assemble_stream(f_out, f_in, bext_data, cart_data):
+    """
+    Write the fixed WAV (fmt -> data -> bext -> cart -> others) from ffmpeg's
+    output as it arrives. The data and RIFF sizes aren't known until the
+    stream ends, so they are patched afterwards.
+    """
+    head = bytearray(b'RIFF\x00\x00\x00\x00WAVE')
+    others = bytearray()
+    data_pos = None
+    data_size = 0
+    
+    for cid, size, raw in yield_stream_chunks(f_in):
+        if cid == b'fmt ':
+            # 1. fmt
+            _append_chunk(head, cid, _fix_fmt(raw[8:]))
+        elif cid == b'data' and data_pos is None:
+            # 2. Data (Immediate audio for legacy compat)
+            data_pos = len(head) + 4
+            head += _CHUNK_HDR.pack(cid, 0)
+            f_out.write(head)
+            data_size = _copy_stream(f_in, f_out, None if size == 0xFFFFFFFF else size)
+            if data_size % 2 == 1: f_out.write(b'\x00')
+        elif cid in (b'bext', b'cart', b'data'):
+            pass
+        else:
+            # Splice header + payload verbatim, only adding the pad byte
+            others += raw
+            if size % 2 == 1: others += b'\x00'
+    if data_pos is None:
+        f_out.write(head)
+
+    # 3. bext/cart (Metadata at end), 4. Others (LIST, etc)
+    tail = bytearray()
+    for cid, d in [(b'bext', bext_data), (b'cart', cart_data)]:
+        _append_chunk(tail, cid, d)
+    tail += others
+    f_out.write(tail)
+    
+    file_size = f_out.tell()
+    f_out.truncate(file_size) # Drop any unused preallocation
+    f_out.seek(4)
+    f_out.write(_U32.pack(file_size - 8))
+    if data_pos is not None:
+        f_out.seek(data_pos)
+        f_out.write(_U32.pack(data_size))
+
+def _claim_tmp(path):
+    """
+    Create `path` exclusively. A leftover that hasn't been written to for
+    STALE_TMP_AGE (killed worker, power loss) is removed and claimed instead.
+    Returns False if a live run holds it.
+    """
+    for _ in range(2):
+        try:
+            os.close(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644))
+            return True
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(path) < STALE_TMP_AGE:
+                    return False
+                os.remove(path)
+            except FileNotFoundError: # Its owner just finished; try again
+                pass
+    return False
+
+def _publish(tmp, dest):
+    """
+    Move a finished temp file to dest without overwriting anything.
+    Returns False if dest already exists.
+    """
+    try:
+        os.link(tmp, dest) # Fails atomically if dest exists
+    except FileExistsError:
+        return False
+    except (AttributeError, OSError): # No hard links here (FAT/exFAT, some shares)
+        if os.path.exists(dest):
+            return False
+        os.replace(tmp, dest)
+        return True
+    os.remove(tmp)
+    return True
+
+def process_single_file(src: str, out_root: Optional[str], in_place: bool, scan=None) -> str:
     """
     Worker function to process a single file.
+    scan is the file's _scan_source() result, if the caller already has it.
     Returns: "SUCCESS", "SKIPPED", "ERROR: <msg>"
     """
+    tmp_final = None
     try:
         src_abs = os.path.abspath(src)
         base = os.path.splitext(os.path.basename(src))[0]
@@ -206,15 +542,25 @@ def process_single_file(src: str, out_root: Optional[str], in_place: bool) -> st
             tmp_final = src_abs + ".bsifix.tmp.wav"
         else:
             if not out_root: return "ERROR: No output root"
-            out_dir = os.path.join(out_root, parent)
-            os.makedirs(out_dir, exist_ok=True)
+            out_dir = os.path.join(out_root, parent) # Created up front by run_batch
             dest = os.path.join(out_dir, base + ".BSI.wav")
-            if os.path.exists(dest):
+            if os.path.exists(dest): # Cheap early out; _publish re-checks atomically
                 return "SKIPPED: Exists"
             tmp_final = dest + ".tmp.wav"
 
+        # Claim the temp file atomically, so two workers never write the same one
+        if not _claim_tmp(tmp_final):
+            held, tmp_final = tmp_final, None # Not ours, leave it alone
+            return f"SKIPPED: {os.path.basename(held)} is in use (or was left less than {STALE_TMP_AGE // 60} min ago)"
+
         # 1. Gather Metadata
-        tags = get_ffprobe_metadata(src_abs)
+        # WAV tags live in LIST/INFO or an id3 chunk; only id3 and other
+        # containers need ffprobe.
+        if scan is None:
+            scan = _scan_source(src_abs)
+        container, pcm, tags, has_id3, fmt_payload, data_chunk_info = scan
+        if tags is None:
+            tags = get_ffprobe_metadata(src_abs) if has_id3 or not pcm else {}
         title = tags.get("title", base)
         artist = tags.get("artist", "Unknown Artist")
         album = tags.get("album", "")
@@ -225,124 +571,79 @@ def process_single_file(src: str, out_root: Optional[str], in_place: bool) -> st
         comment = tags.get("comment", "")
         encoded_by = tags.get("encoded_by", "")
         
-        # 2. FFmpeg Pass (Transcode)
-        ffmpeg_tmp = tmp_final + ".ffmpeg.wav"
-        
-        # Build metadata args
-        meta_args = []
-        for k, v in [
+        meta = [
             ("title", title), ("artist", artist), ("album", album), 
             ("date", date), ("genre", genre), ("track", track),
             ("composer", composer), ("comment", comment), ("encoded_by", encoded_by)
-        ]:
-            if v:
-                meta_args.extend(["-metadata", f"{k}={v}"])
-
-        cmd = [
-            "ffmpeg", "-y", "-v", "error",
-            "-i", src_abs,
-            "-c:a", "pcm_s24le",
-            "-map_metadata", "-1", # Clear input metadata
-        ] + meta_args + [
-            "-f", "wav",
-            ffmpeg_tmp
         ]
-        
-        subprocess.run(cmd, check=True)
-        
-        # 3. Post-Process Chunks (Streaming)
-        with open(ffmpeg_tmp, 'rb') as f_in:
-            header = f_in.read(12)
-            riff, _, wave = struct.unpack('<4sI4s', header)
-            
-            input_chunks = list(yield_chunks(f_in))
-            
-        new_chunks_info = [] 
+
+        # 2. FFmpeg Pass (Transcode)
+        # 16/24-bit PCM only needs its chunks rewritten, so read the source directly.
+        transcode = not _can_skip_ffmpeg(container, pcm)
+
+        if transcode:
+            # Build metadata args
+            meta_args = []
+            for k, v in meta:
+                if v:
+                    meta_args.extend(["-metadata", f"{k}={v}"])
+
+            # RF64/BW64 keeps its sizes in ds64, so PCM there still goes through
+            # ffmpeg, but only needs remuxing into RIFF, not re-encoding.
+            codec = "copy" if pcm and pcm[1] in (16, 24) else "pcm_s24le"
+
+            cmd = [
+                "ffmpeg", "-y", "-v", "error",
+                "-i", src_abs,
+                "-c:a", codec,
+                "-map_metadata", "-1", # Clear input metadata
+            ] + meta_args + [
+                "-f", "wav",
+                "-" # Piped straight into the assembly below, no temp WAV
+            ]
         
         bext_data = build_bext_chunk(title, artist, None, None)
         cart_data = build_cart_chunk(title, artist, base)
         
-        fmt_chunk = None
-        data_chunk_info = None
-        other_chunks = []
-        
-        for cid, size, payload in input_chunks:
-            if cid == b'fmt ':
-                if isinstance(payload, bytes) and len(payload) >= 20:
-                     wFormatTag = struct.unpack('<H', payload[:2])[0]
-                     if wFormatTag == 0xFFFE: # Extensible -> PCM
-                         nChannels, nSamplesPerSec, nAvgBytes, nBlockAlign, wBits = struct.unpack('<HIIHH', payload[2:16])
-                         payload = struct.pack('<HHIIHH', 0x0001, nChannels, nSamplesPerSec, nAvgBytes, nBlockAlign, wBits)
-                fmt_chunk = (cid, payload)
-            elif cid == b'data':
-                data_chunk_info = (cid, size, payload)
-            elif cid in (b'bext', b'cart'):
-                 pass 
-            else:
-                other_chunks.append((cid, size, payload))
-                
-        # Assembly
-        with open(ffmpeg_tmp, 'rb') as f_in, open(tmp_final, 'wb') as f_out:
-            f_out.write(b'RIFF\x00\x00\x00\x00WAVE')
-            
-            # 1. fmt
-            if fmt_chunk:
-                f_out.write(fmt_chunk[0])
-                f_out.write(struct.pack('<I', len(fmt_chunk[1])))
-                f_out.write(fmt_chunk[1])
-                if len(fmt_chunk[1]) % 2 == 1: f_out.write(b'\x00')
-                
-            # 2. Data (Immediate audio for legacy compat)
-            if data_chunk_info:
-                cid, size, offset = data_chunk_info
-                f_out.write(cid)
-                f_out.write(struct.pack('<I', size))
-                f_in.seek(offset)
-                remaining = size
-                while remaining > 0:
-                    chunk = f_in.read(min(remaining, COPY_BUF_SIZE))
-                    if not chunk: break
-                    f_out.write(chunk)
-                    remaining -= len(chunk)
-                if size % 2 == 1: f_out.write(b'\x00')
-
-            # 3. bext/cart (Metadata at end)
-            for cid, d in [(b'bext', bext_data), (b'cart', cart_data)]:
-                f_out.write(cid)
-                f_out.write(struct.pack('<I', len(d)))
-                f_out.write(d)
-                if len(d) % 2 == 1: f_out.write(b'\x00')
-                
-            # 4. Others (LIST, etc)
-            for cid, size, payload in other_chunks:
-                f_out.write(cid)
-                f_out.write(struct.pack('<I', size))
-                if isinstance(payload, int): # Offset
-                    f_in.seek(payload)
-                    remaining = size
-                    while remaining > 0:
-                        chunk = f_in.read(min(remaining, COPY_BUF_SIZE))
-                        if not chunk: break
-                        f_out.write(chunk)
-                        remaining -= len(chunk)
-                else:
-                    f_out.write(payload)
-                if size % 2 == 1: f_out.write(b'\x00')
-            
-            file_size = f_out.tell()
-            f_out.seek(4)
-            f_out.write(struct.pack('<I', file_size - 8))
-            
-        # Cleanup temp
-        if os.path.exists(ffmpeg_tmp):
-            os.remove(ffmpeg_tmp)
+        # 3. Post-Process Chunks
+        if transcode:
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, bufsize=COPY_BUF_SIZE)
+            try:
+                with proc.stdout as f_in, open(tmp_final, 'wb') as f_out:
+                    # Output size isn't known yet; the source size plus our chunks is a fair guess
+                    _preallocate(f_out, os.path.getsize(src_abs) + 8192)
+                    _assemble_stream(f_out, f_in, bext_data, cart_data)
+            except BaseException:
+                proc.kill()
+                raise
+            finally:
+                proc.wait()
+            if proc.returncode != 0:
+                raise subprocess.CalledProcessError(proc.returncode, cmd)
+        else:
+            with open(src_abs, 'rb') as f_in, open(tmp_final, 'wb') as f_out:
+                # Source metadata is replaced, same as ffmpeg's -map_metadata -1
+                _assemble_mapped(f_out, f_in, fmt_payload, data_chunk_info,
+                                 bext_data, cart_data, build_info_chunk(meta))
             
         # Final move
-        os.replace(tmp_final, dest)
+        if in_place:
+            os.replace(tmp_final, dest)
+        elif not _publish(tmp_final, dest):
+            os.remove(tmp_final)
+            return "SKIPPED: Exists"
         
         return "SUCCESS"
 
-    except Exception as e:
+    except BaseException as e:
+        # Don't leave a partial temp file, even on Ctrl-C
+        if tmp_final:
+            try:
+                os.remove(tmp_final)
+            except OSError:
+                pass
+        if not isinstance(e, Exception):
+            raise
         return f"ERROR: {str(e)}"
 
 
@@ -350,6 +651,37 @@ def process_single_file(src: str, out_root: Optional[str], in_place: bool) -> st
 # Orchestration
 # ------------------------------------------------------------------------------
 
+_executor = None
+_executor_key = None
+
+def _get_executor(workers: int, threads: bool = False) -> Executor:
+    """Return the shared worker pool, so repeated batches don't respawn workers."""
+    global _executor, _executor_key
+    if _executor is None or _executor_key != (threads, workers):
+        _shutdown_executor()
+        if threads:
+            _executor = ThreadPoolExecutor(max_workers=workers)
+        else:
+            _executor = ProcessPoolExecutor(max_workers=workers)
+        _executor_key = (threads, workers)
+    return _executor
+
+def _shutdown_executor():
+    global _executor
+    if _executor is not None:
+        # Queued files are dropped; only the ones already running finish
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
+
+atexit.register(_shutdown_executor)
+
+def _size_or_zero(path):
+    """Sort key: file size, or 0 if it can't be read (the worker reports why)."""
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
 def run_batch(files: List[str], in_place: bool, parallel: int = None):
     out_root = None
     if not in_place:
@@ -366,8 +698,24 @@ def run_batch(files: List[str], in_place: bool, parallel: int = None):
         console.print("[yellow]No files found to process.[/yellow]")
         return
 
+    # Largest first, so a long show doesn't start last and leave the other workers idle
+    files = sorted(files, key=_size_or_zero, reverse=True)
+
+    if out_root:
+        # One mkdir per output folder, not one per file
+        parents = {os.path.basename(os.path.dirname(os.path.abspath(f))) for f in files}
+        for parent in parents:
+            os.makedirs(os.path.join(out_root, parent), exist_ok=True)
+
     workers = parallel or (os.cpu_count() or 4)
-    console.print(f"Processing [bold]{len(files)}[/bold] files with [bold]{workers}[/bold] workers...")
+    # Without ffmpeg each file is pure I/O (sendfile drops the GIL), so
+    # threads beat processes; any transcode needs real processes.
+    # Each source is scanned once here; workers reuse the result.
+    scans = [_scan_source(f) for f in files]
+    threads = all(_can_skip_ffmpeg(sc[0], sc[1]) for sc in scans)
+    if threads:
+        workers *= 2
+    console.print(f"Processing [bold]{len(files)}[/bold] files with [bold]{workers}[/bold] {'threads' if threads else 'workers'}...")
     
     success = 0
     skipped = 0
@@ -383,27 +731,41 @@ def run_batch(files: List[str], in_place: bool, parallel: int = None):
     ) as progress:
         task_id = progress.add_task("Fixing WAVs...", total=len(files))
         
-        with ProcessPoolExecutor(max_workers=workers) as executor:
-            future_to_file = {executor.submit(process_single_file, f, out_root, in_place): f for f in files}
-            
-            for future in as_completed(future_to_file):
-                f = future_to_file[future]
-                try:
-                    res = future.result()
-                    if res == "SUCCESS":
-                        success += 1
-                        # console.log(f"[green]✓[/green] {os.path.basename(f)}")
-                    elif res.startswith("SKIPPED"):
-                        skipped += 1
-                        console.log(f"[yellow]↔[/yellow] {os.path.basename(f)} (Skipped)")
-                    else:
-                        errors += 1
-                        console.log(f"[red]✗[/red] {os.path.basename(f)}: {res}")
-                except Exception as exc:
+        executor = _get_executor(workers, threads)
+        futures = {}
+        
+        try:
+            # One task per file, taken in size order by whichever worker is free;
+            # results are counted as they finish so the bar never waits on a big file.
+            futures = {executor.submit(process_single_file, f, out_root, in_place, sc): f
+                       for f, sc in zip(files, scans)}
+            for fut in as_completed(futures):
+                f = futures[fut]
+                res = fut.result()
+                if res == "SUCCESS":
+                    success += 1
+                    # console.log(f"[green]✓[/green] {os.path.basename(f)}")
+                elif res.startswith("SKIPPED"):
+                    skipped += 1
+                    console.log(f"[yellow]↔[/yellow] {os.path.basename(f)} (Skipped: {res.partition(': ')[2]})")
+                else:
                     errors += 1
-                    console.log(f"[red]✗[/red] {os.path.basename(f)} generated exception: {exc}")
+                    console.log(f"[red]✗[/red] {os.path.basename(f)}: {res}")
                 
                 progress.advance(task_id)
+        except KeyboardInterrupt:
+            # Worker threads never see SIGINT, so stop queued files here
+            # rather than letting the exit-time shutdown run them all.
+            for fut in futures:
+                fut.cancel()
+            _shutdown_executor()
+            raise
+        except Exception as exc:
+            # Only a dead pool gets here (workers catch their own errors)
+            _shutdown_executor()
+            failed = len(files) - (success + skipped + errors)
+            errors += failed
+            console.log(f"[red]✗[/red] Worker pool failed, {failed} files not processed: {exc}")
 
     # Summary Table
     table = Table(title="Processing Summary", show_header=True, header_style="bold magenta")
@@ -419,7 +781,7 @@ def run_batch(files: List[str], in_place: bool, parallel: int = None):
         console.print(f"\nFiles saved to: [bold underline]{out_root}[/bold underline]")
 
 def interactive_wizard():
-    console.print(Panel.fit("[bold white on blue] BSI WAV Fixer Wizard [/bold white on blue]\n\nThis tool will fix WAV files for BSI radio automation.\nIt converts them to 24-bit PCM and injects required chunks."))
+    console.print(Panel.fit("[bold white on blue] BSI WAV Fixer Wizard [/bold white on blue]\n\nThis tool will fix WAV files for BSI radio automation.\nIt keeps 16/24-bit PCM as-is (converting anything else to 24-bit PCM)\nand injects required chunks."))
     
     # 1. Select Path
     path_input = Prompt.ask("Enter file glob or directory (e.g. 'Music/*.wav')")